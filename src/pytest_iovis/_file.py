@@ -13,6 +13,8 @@ class JupyterNotebookFile(pytest.Module):
     parameterization)
     """
 
+    __slots__ = ("_test_functions",)
+
     def __init__(self, *args: object, test_functions: List[TestObject], **kwargs: object) -> None:
         super().__init__(*args, **kwargs)  # type: ignore[arg-type]
         self._test_functions = test_functions
@@ -33,8 +35,7 @@ class JupyterNotebookFile(pytest.Module):
         """
         module = types.ModuleType(name="jupyter_notebook_collector")
 
-        for f in self._test_functions:
-            # Need to add test functions to the module since pytest tries to access them
-            setattr(module, f.__name__, f)
+        # Need to add test functions to the module since pytest tries to access them
+        module.__dict__.update((f.__name__, f) for f in self._test_functions)
 
         return module
@@ -1,3 +1,4 @@
+import functools
 import types
 from pathlib import Path
 from typing import Iterable
@@ -8,6 +9,12 @@ from ._subplugins import JupyterNotebookDiscoverer
 from ._venv_builder import ThinEnvBuilder
 
 
+@functools.lru_cache(maxsize=None)
+def _cached_builder(*, with_pip: bool) -> ThinEnvBuilder:
+    """Return a ThinEnvBuilder, reusing builders across calls since inspecting the host environment isn't free."""
+    return ThinEnvBuilder.make_builder(with_pip=with_pip)
+
+
 @pytest.fixture()
 def notebook_path(request: pytest.FixtureRequest) -> Path:
     """Return the path to the notebook under test."""
@@ -21,23 +28,31 @@ def notebook_path(request: pytest.FixtureRequest) -> Path:
     return path
 
 
+@pytest.fixture(scope="session")
+def iovis_shared_venv(tmp_path_factory: pytest.TempPathFactory) -> types.SimpleNamespace:
+    """Create a single virtual environment for the session. Used by `venv` when `--iovis-shared-venv` is passed."""
+    return _cached_builder(with_pip=True).create(tmp_path_factory.mktemp(".venv_iovis_shared"))
+
+
 @pytest.fixture()
 def venv(
     request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> Iterable[types.SimpleNamespace]:
     """Activate a virtual environment which has access to all packages in the host environment.
 
+    A fresh environment is created for each test, unless `--iovis-shared-venv` is passed.
+
     :return: The SimpleNamespace returned by venv.VenvBuilder.ensure_directories.
     :rtype: types.SimpleNamespace
     .. see-also::
         https://docs.python.org/3/library/venv.html#venv.EnvBuilder.ensure_directories
     """
-    node = request.node
-    test_name = node.originalname if isinstance(node, pytest.Function) else node.name
-    env_dir = tmp_path / f".venv_iovis_{test_name}"
-
-    builder = ThinEnvBuilder.make_builder(with_pip=True)
-    context = builder.create(env_dir)
+    if request.config.getoption("iovis_shared_venv"):
+        context: types.SimpleNamespace = request.getfixturevalue(iovis_shared_venv.__name__)
+    else:
+        node = request.node
+        test_name = getattr(node, "originalname", node.name)
+        context = _cached_builder(with_pip=True).create(tmp_path / f".venv_iovis_{test_name}")
 
     # THIS IS A HACK
     #
@@ -50,5 +65,5 @@ def venv(
     # https://github.com/jupyter/jupyter_client/blob/d044eb53cb64489c81ac47944a3b9e79db1dd926/jupyter_client/manager.py#L292-L303
     monkeypatch.setattr("sys.executable", context.env_exe)
 
-    with builder.activate(context):
+    with ThinEnvBuilder.activate(context):
         yield context
@@ -19,14 +19,15 @@ plugin as follows:
     https://pluggy.readthedocs.io/en/latest/#define-and-collect-hooks
     https://docs.python.org/3/tutorial/classes.html#tut-scopes
 """
-import importlib
-
 from .discovery import JupyterNotebookDiscoverer
 from .markup import IPythonMarkupPlugin
 
-if importlib.util.find_spec("papermill") is not None:
+try:
     from .papermill_runner import PapermillTestRunner
-else:
+except ModuleNotFoundError as e:
+    # Only fall back when papermill itself is missing, not when one of its dependencies is broken
+    if e.name != "papermill":
+        raise
 
     class PapermillTestRunner:  # type: ignore[no-redef]
         PLUGIN_NAME = "papermill_runner"
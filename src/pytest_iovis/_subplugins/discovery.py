@@ -1,6 +1,7 @@
+import os
 import types
 from pathlib import Path
-from typing import Callable, Dict, Iterable, Optional, Tuple, Union, cast
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple, Union, cast
 
 import pytest
 from typing_extensions import TypeGuard
@@ -70,13 +71,20 @@ class ScopedFunctionHandler:
 
         global_test_functions = tuple(result or ())
 
+        hook_plugins = self.hook_plugins(manager)
+
         self.path_trie = PathTrie(root_payload=global_test_functions)
-        for conftest in sorted(conftest_plugins, key=lambda c: Path(c.__file__ or "")):
+        # A conftest that doesn't implement the hook can't contribute to the index
+        scoped_conftests = [(Path(c.__file__ or "").parent, c) for c in conftest_plugins if c in hook_plugins]
+        # Sort by directory, so that a conftest is always added before those in its subdirectories. The string form is
+        # compared, since it's cheaper than comparing Paths and still orders a directory before its subdirectories.
+        scoped_conftests.sort(key=lambda dir_and_conftest: str(dir_and_conftest[0]))
+        for confdir, conftest in scoped_conftests:
             assert conftest.__file__
             self.add_scoped_hook(
                 manager,
-                Path(conftest.__file__).parent,
-                self.call_hook_without(manager, all_plugins.difference({conftest})),
+                confdir,
+                self.call_hook_without(manager, hook_plugins.difference({conftest})),
             )
 
     @pytest.hookimpl(hookwrapper=True)
@@ -92,7 +100,20 @@ class ScopedFunctionHandler:
 
     @staticmethod
     def is_conftest(obj: object) -> TypeGuard[types.ModuleType]:
-        return isinstance(obj, types.ModuleType) and Path(obj.__file__ or ".").name == "conftest.py"
+        if not isinstance(obj, types.ModuleType):
+            return False
+
+        # Called for every registered plugin, so a plain string check is used instead of building a Path
+        return os.path.basename(obj.__file__ or "") == "conftest.py"  # noqa: PTH119
+
+    @staticmethod
+    def hook_plugins(manager: pytest.PytestPluginManager) -> Set[object]:
+        """Return the plugins that implement the hook.
+
+        Only these plugins need to be excluded from a subset hook caller, and they're usually far fewer than all
+        plugins.
+        """
+        return {impl.plugin for impl in getattr(manager.hook, ScopedFunctionHandler.HOOK_NAME).get_hookimpls()}
 
     @staticmethod
     def call_hook_without(manager: pytest.PytestPluginManager, plugins: Iterable[object]) -> SetTestsHook:
@@ -100,7 +121,7 @@ class ScopedFunctionHandler:
         return manager.subset_hook_caller(ScopedFunctionHandler.HOOK_NAME, remove_plugins=plugins)
 
     def pytest_plugin_registered(self, plugin: object, manager: pytest.PytestPluginManager) -> None:
-        if not self.is_conftest(plugin):
+        if not (self.is_conftest(plugin) and hasattr(plugin, self.HOOK_NAME)):
             return
 
         assert plugin.__file__
@@ -108,38 +129,50 @@ class ScopedFunctionHandler:
         self.add_scoped_hook(
             manager,
             Path(plugin.__file__).parent,
-            self.call_hook_without(manager, manager.get_plugins().difference({plugin})),
+            self.call_hook_without(manager, self.hook_plugins(manager).difference({plugin})),
         )
 
-    def add_scoped_hook(self, manager: pytest.PytestPluginManager, scope: Path, hook: SetTestsHook) -> None:
+    def add_scoped_hook(
+        self, manager: pytest.PytestPluginManager, scope: Path, hook: SetTestsHook
+    ) -> Optional[Tuple[TestObject, ...]]:
         """Invoke the hook function for the specified scope, and add the result to our function index.
 
         :param pytest.PytestPluginManager manager: The pytest plugin manager for the current session
         :param Path scope: The scope the hook applies to
         :param SetTestFunctionHook hook: The hook function to invoke
+        :returns: The test functions added to the index for the scope, or None if the index wasn't updated
+        :rtype: Optional[Tuple[TestObject, ...]]
         """
         path_trie = self.path_trie
         if path_trie is None:
-            return
+            return None
 
         if scope in path_trie:
-            return
-
-        empty_hook_caller = manager.subset_hook_caller(self.HOOK_NAME, manager.get_plugins())
+            return None
 
         def make_register_fn(
             confdir: Path,
         ) -> Callable[[PathType], Callable[[SetTestsForFileCallback], None]]:
+            confdir_parts = confdir.parts
+
             def tests_for(path: PathType) -> Callable[[SetTestsForFileCallback], None]:
-                pathlib_path = Path(path) if Path(path).is_absolute() else Path(scope, path).resolve()
+                pathlib_path = Path(path)
+                if not pathlib_path.is_absolute():
+                    # Only collapse `..` segments, since stat-ing every parent (as `Path.resolve` does) isn't needed
+                    pathlib_path = Path(os.path.normpath(Path(scope, pathlib_path)))
                 __tracebackhide__ = True  # Hide this function from traceback
-                if confdir not in pathlib_path.parents:
+                # Equivalent to `confdir in pathlib_path.parents`, without building every ancestor of the path
+                path_parts = pathlib_path.parts
+                if len(path_parts) <= len(confdir_parts) or path_parts[: len(confdir_parts)] != confdir_parts:
                     pytest.fail(f"{tests_for.__name__}'s path must be a subpath of the calling conftest's directory.")
 
                 if not pathlib_path.is_file():
                     pytest.fail(f"Not a file: {pathlib_path}")
 
                 def decorator(f: SetTestsForFileCallback) -> None:
+                    # Only built once `tests_for` is actually used, since most conftests never call it
+                    empty_hook_caller = manager.subset_hook_caller(self.HOOK_NAME, self.hook_plugins(manager))
+
                     def hook(
                         current_tests: Tuple[TestObject, ...], tests_for: object  # noqa: ARG001
                     ) -> Iterable[TestObject]:
@@ -159,23 +192,33 @@ class ScopedFunctionHandler:
         current_funcs = self.test_functions_for(scope)
         functions_for_scope = hook(current_tests=tuple(current_funcs), tests_for=make_register_fn(scope))
         if functions_for_scope is None:
-            return
+            return None
+
+        functions_for_scope = tuple(functions_for_scope)
 
         # Sanity check to make sure we're getting scopes that are always more specific
-        assert path_trie.insert(scope, tuple(functions_for_scope)) == PathTrie.InsertType.LEAF
+        assert path_trie.insert(scope, functions_for_scope) == PathTrie.InsertType.LEAF
+
+        return functions_for_scope
 
-    def add_scoped_hook_for_file(self, manager: pytest.PytestPluginManager, path: Path) -> None:
+    def add_scoped_hook_for_file(
+        self, manager: pytest.PytestPluginManager, path: Path
+    ) -> Optional[Tuple[TestObject, ...]]:
         """Invoke the hook function for the specified scope, and add the result to our function index.
 
         :param pytest.PytestPluginManager manager: The pytest plugin manager for the current session
         :param Path scope: The scope the hook applies to
         :param SetDefaultHookFunction hook: The hook function to invoke
+        :returns: The test functions added to the index for the file, or None if the index wasn't updated
+        :rtype: Optional[Tuple[TestObject, ...]]
         """
         assert path.is_file()
         file_hooks = self.file_hooks
         hook = file_hooks.pop(path, None)
-        if hook is not None:
-            self.add_scoped_hook(manager, scope=path, hook=hook)
+        if hook is None:
+            return None
+
+        return self.add_scoped_hook(manager, scope=path, hook=hook)
 
     def test_functions_for(self, p: PathType) -> Iterable[TestObject]:
         """Compute the test functions that are in-scope at a given path.
@@ -199,8 +242,12 @@ class JupyterNotebookDiscoverer:
     """A user facing name that describes this plugin."""
     __FUNCTION_HANDLER_KEY = pytest.StashKey[ScopedFunctionHandler]()
     """The stash key used to retrieve a ScopedFunctionHandler from the config stash."""
+    __NOTEBOOK_PATH_KEY = pytest.StashKey[Optional[Path]]()
+    """The stash key used to cache the notebook path associated with a node."""
     FIXTURE_NAME = "notebook_path"
     """The name of the fixture that will be parametrized by this plugin"""
+    NOTEBOOK_SUFFIXES = frozenset({".ipynb"})
+    """The file suffixes collected as Jupyter Notebooks."""
 
     @pytest.hookimpl(trylast=True)
     def pytest_iovis_set_tests(self) -> Iterable[TestObject]:
@@ -217,18 +264,22 @@ class JupyterNotebookDiscoverer:
 
     def pytest_collect_file(self, file_path: Path, parent: pytest.Collector) -> Optional[pytest.Collector]:
         """Make pytest.Collectors for Jupyter Notebooks."""
-        if file_path.suffix in [".ipynb"]:
-            func_manager = parent.config.stash[self.__FUNCTION_HANDLER_KEY]
-            func_manager.add_scoped_hook_for_file(parent.config.pluginmanager, file_path)
-            return cast(
-                JupyterNotebookFile,
-                JupyterNotebookFile.from_parent(
-                    parent,
-                    path=file_path,
-                    test_functions=func_manager.test_functions_for(file_path),
-                ),
-            )
-        return None
+        if file_path.suffix not in self.NOTEBOOK_SUFFIXES:
+            return None
+
+        func_manager = parent.config.stash[self.__FUNCTION_HANDLER_KEY]
+        test_functions = func_manager.add_scoped_hook_for_file(parent.config.pluginmanager, file_path)
+        if test_functions is None:
+            test_functions = tuple(func_manager.test_functions_for(file_path))
+
+        return cast(
+            JupyterNotebookFile,
+            JupyterNotebookFile.from_parent(
+                parent,
+                path=file_path,
+                test_functions=test_functions,
+            ),
+        )
 
     @classmethod
     def is_managed_function(cls, item: Union[pytest.Item, pytest.Collector]) -> TypeGuard[pytest.Function]:
@@ -238,6 +289,15 @@ class JupyterNotebookDiscoverer:
     @classmethod
     def get_notebook_path(cls, item: Union[pytest.Item, pytest.Collector]) -> Optional[Path]:
         """Get the notebook path associated with a test function."""
+        stash = item.stash
+        if cls.__NOTEBOOK_PATH_KEY not in stash:
+            stash[cls.__NOTEBOOK_PATH_KEY] = cls._find_notebook_path(item)
+
+        return stash[cls.__NOTEBOOK_PATH_KEY]
+
+    @classmethod
+    def _find_notebook_path(cls, item: Union[pytest.Item, pytest.Collector]) -> Optional[Path]:
+        """Find the notebook path associated with a test function, without consulting the node's cache."""
         if not cls.is_managed_function(item):
             return None
 
@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Optional
 
@@ -27,10 +28,19 @@ class IPythonMarkupPlugin:
         if not self.should_output_color:
             return "--InteractiveShell.colors=NoColor"
 
-        # Up until IPython 8.15, it was not possible to configure the colorscheme used for tracebacks.
-        # For IPython between 8.0.0 and 8.15.0, we monkeypatch IPython on startup to force it to use the right colors.
-        # For IPython above 8.15.0, we just set the appropriate config value.
-        return f"""--IPKernelApp.exec_lines=
+        return _make_exec_lines_arg(self.style_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _make_exec_lines_arg(style_name: str) -> str:
+    """Return an IPykernel argument that makes IPython tracebacks use the given pygments style.
+
+    Cached, since the argument is requested for every notebook test but only depends on the style name.
+    """
+    # Up until IPython 8.15, it was not possible to configure the colorscheme used for tracebacks.
+    # For IPython between 8.0.0 and 8.15.0, we monkeypatch IPython on startup to force it to use the right colors.
+    # For IPython above 8.15.0, we just set the appropriate config value.
+    return f"""--IPKernelApp.exec_lines=
     import IPython.core.ultratb
     from IPython import version_info
     def __set_traceback_highlighting_style():
@@ -39,7 +49,7 @@ class IPythonMarkupPlugin:
         import functools
         @functools.wraps(get_style_by_name)
         def _(style: str) -> str:
-            return get_style_by_name({self.style_name!r})
+            return get_style_by_name({style_name!r})
 
         IPython.core.ultratb.get_style_by_name = _
 
@@ -55,7 +65,7 @@ class IPythonMarkupPlugin:
 
         if version_info >= (8, 15):
             from IPython.core.ultratb import VerboseTB
-            VerboseTB._tb_highlight_style = {self.style_name!r}
+            VerboseTB._tb_highlight_style = {style_name!r}
 
     if (8,) <= version_info and version_info < (8, 15):
         __set_traceback_highlighting_style()
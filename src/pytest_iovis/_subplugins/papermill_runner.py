@@ -20,6 +20,8 @@ class PapermillTestRunner:
 
     PLUGIN_NAME = "papermill_runner"
     """A user facing name that describes this plugin."""
+    __MARKUP_PLUGIN_KEY = pytest.StashKey[Optional[IPythonMarkupPlugin]]()
+    """The stash key used to cache the registered IPythonMarkupPlugin in the config stash."""
 
     @pytest.fixture()
     def papermill_execute(
@@ -67,9 +69,14 @@ class PapermillTestRunner:
     @pytest.fixture()
     def papermill_extra_arguments(self, request: pytest.FixtureRequest) -> List[str]:
         """Return a list passed as the extra_arguments parameter for papermill.execute_notebook."""
-        style_plugin: Optional[IPythonMarkupPlugin] = next(
-            (p for p in request.config.pluginmanager.get_plugins() if isinstance(p, IPythonMarkupPlugin)), None
-        )
+        stash = request.config.stash
+        if self.__MARKUP_PLUGIN_KEY not in stash:
+            # Looked up once per session, instead of scanning every registered plugin for each notebook test
+            stash[self.__MARKUP_PLUGIN_KEY] = next(
+                (p for p in request.config.pluginmanager.get_plugins() if isinstance(p, IPythonMarkupPlugin)), None
+            )
+
+        style_plugin = stash[self.__MARKUP_PLUGIN_KEY]
 
         if style_plugin:
             return [style_plugin.get_ipython_markup_arg()]
@@ -106,9 +113,8 @@ class PapermillTestRunner:
 
         exc: pm.PapermillExecutionError = excinfo.value
 
-        report.longrepr = "\n".join(exc.traceback)
-
         # Path in nodeid is relative (shorter + more consistent with rest of pytest output)
         node_path = node.nodeid.split("::", maxsplit=1)[0]
 
-        report.longrepr += f"\n\n{node_path}:cell {exc.cell_index + 1}: {exc.ename}"
+        # A single join, rather than appending the summary to the (potentially large) joined traceback
+        report.longrepr = "\n".join([*exc.traceback, "", f"{node_path}:cell {exc.cell_index + 1}: {exc.ename}"])
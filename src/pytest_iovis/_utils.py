@@ -1,8 +1,7 @@
 import enum
 import os
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union, cast, overload
+import sys
+from typing import Any, Callable, Dict, Final, Generic, Iterable, List, Optional, Tuple, TypeVar, Union, overload
 
 from typing_extensions import Self, TypeGuard
 
@@ -44,18 +43,26 @@ def partition(
     return yes, no
 
 
+class _NoPayload(enum.Enum):
+    """A sentinel type used to signify that a PathTrie Node has no payload."""
+
+    NO_PAYLOAD = enum.auto()
+
+
+_NO_PAYLOAD: Final = _NoPayload.NO_PAYLOAD
+
+
 class PathTrie(Generic[T]):
     """A trie that accepts the parts (i.e `Path.parts`) of an absolute path, and stores some associated payload."""
 
-    class NoPayload:
-        """A distinct type used to signify that a PathTrie Node has no payload."""
-
-    @dataclass
     class Node(Generic[T2]):
         """A Node of a PathTrie that can store a generic payload."""
 
-        payload: Union[T2, Type["PathTrie.NoPayload"]] = field(default_factory=lambda: PathTrie.NoPayload)
-        children: Dict[str, Self] = field(default_factory=dict)
+        __slots__ = ("payload", "children")
+
+        def __init__(self, payload: Union[T2, _NoPayload]) -> None:
+            self.payload = payload
+            self.children: Dict[str, Self] = {}
 
     class InsertType(enum.Enum):
         LEAF = enum.auto()
@@ -65,11 +72,28 @@ class PathTrie(Generic[T]):
 
     def __init__(self, root_payload: T) -> None:
         self.root: PathTrie.Node[T] = PathTrie.Node(payload=root_payload)
+        self._parts_cache: Dict[str, Tuple[str, ...]] = {}
+        """A cache of the parts of normalized paths, since normalizing a path requires querying the filesystem."""
 
     @staticmethod
-    def _normalize(p: PathType) -> Path:
-        """Normalize the path argument."""
-        return Path(p).resolve()
+    def _normalize(p: PathType) -> Tuple[str, ...]:
+        """Normalize the path argument, returning the parts of the resolved path.
+
+        Equivalent to `Path(p).resolve().parts`, but works on strings directly instead of building `Path` objects.
+        """
+        drive, rest = os.path.splitdrive(os.path.realpath(p))
+        # Splitting the string ourselves is the point, since `Path.parts` would require constructing a `Path`
+        return (drive + os.sep, *filter(None, rest.split(os.sep)))  # noqa: PTH206
+
+    def _parts(self, p: PathType) -> Tuple[str, ...]:
+        """Return the parts of the normalized path argument."""
+        key = os.fspath(p)
+        parts = self._parts_cache.get(key)
+        if parts is None:
+            # Interned, since the same directory names show up repeatedly as keys in the trie
+            parts = self._parts_cache[key] = tuple(map(sys.intern, self._normalize(key)))
+
+        return parts
 
     def __contains__(self, obj: object) -> bool:
         """Return whether the PathTrie has a payload for the given object."""
@@ -78,12 +102,13 @@ class PathTrie(Generic[T]):
 
         curr = self.root
 
-        for part in self._normalize(obj).parts:
-            if part not in curr.children:
+        for part in self._parts(obj):
+            child = curr.children.get(part)
+            if child is None:
                 return False
-            curr = curr.children[part]
+            curr = child
 
-        return curr.payload is not PathTrie.NoPayload
+        return curr.payload is not _NO_PAYLOAD
 
     def insert(self, p: Optional[PathType], payload: T) -> "PathTrie.InsertType":
         """Insert a payload for a given path.
@@ -96,10 +121,12 @@ class PathTrie(Generic[T]):
         curr = self.root
         insert_type = PathTrie.InsertType.PREFIX
 
-        for part in self._normalize(p).parts if p is not None else ():
-            if part not in curr.children:
+        for part in self._parts(p) if p is not None else ():
+            child = curr.children.get(part)
+            if child is None:
                 insert_type = PathTrie.InsertType.LEAF
-            curr = curr.children.setdefault(part, PathTrie.Node())
+                child = curr.children[part] = PathTrie.Node(_NO_PAYLOAD)
+            curr = child
 
         curr.payload = payload
         return insert_type
@@ -115,15 +142,20 @@ class PathTrie(Generic[T]):
         """
         curr = self.root
         result = self.root.payload
-        assert result is not PathTrie.NoPayload, "root node should always have a valid payload"
+        assert result is not _NO_PAYLOAD, "root node should always have a valid payload"
+
+        if not curr.children:
+            # Avoid normalizing the path when the root is the only possible match
+            return result
 
-        for part in self._normalize(p).parts:
-            if part not in curr.children:
+        for part in self._parts(p):
+            child = curr.children.get(part)
+            if child is None:
                 break
 
-            curr = curr.children[part]
+            curr = child
 
-            if curr.payload is not PathTrie.NoPayload:
+            if curr.payload is not _NO_PAYLOAD:
                 result = curr.payload
 
-        return cast(T, result)
+        return result
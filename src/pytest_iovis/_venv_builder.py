@@ -71,6 +71,18 @@ class ThinEnvBuilder(venv.EnvBuilder):
         del self._context
         return context
 
+    def _make_pip_available_in_bin_path(self, context: types.SimpleNamespace) -> None:
+        """Make the `pip` command available in the $PATH of the environment."""
+        generate_script = "\n".join(
+            [
+                inspect.getsource(_make_packages_available_on_path),
+                "",
+                "if __name__ == '__main__':",
+                f"    {_make_packages_available_on_path.__name__}(['pip'])",
+            ]
+        )
+        subprocess.run([context.env_exe, "-c", generate_script], check=True, capture_output=True)
+
     @staticmethod
     @contextlib.contextmanager
     def activate(context: types.SimpleNamespace) -> Iterator[None]:
@@ -143,18 +155,6 @@ class ThinEnvBuilderFromVenv(ThinEnvBuilder):
         if self.with_pip_from_host:
             self._make_pip_available_in_bin_path(context)
 
-    def _make_pip_available_in_bin_path(self, context: types.SimpleNamespace) -> None:
-        """Make the `pip` command available in the $PATH of the environment."""
-        generate_script = "\n".join(
-            [
-                inspect.getsource(_make_packages_available_on_path),
-                "",
-                "if __name__ == '__main__':",
-                f"    {_make_packages_available_on_path.__name__}(['pip'])",
-            ]
-        )
-        subprocess.run([context.env_exe, "-c", generate_script], check=True, capture_output=True)
-
     @staticmethod
     def lib_path(context: types.SimpleNamespace) -> Path:
         """Fetch the environment context's directory for site-specific, not-platform-specific files.
@@ -234,15 +234,37 @@ class ThinEnvBuilderFromSystemInstall(ThinEnvBuilder):
         with_pip: bool = False,
         prompt: Optional[str] = None,
     ) -> None:
+        host_has_pip = importlib.util.find_spec("pip") is not None
+
+        self.with_pip_from_host: bool = with_pip and host_has_pip
+        """Whether to use the host's pip to make a `pip` command available on path, instead of running ensurepip."""
+
         super().__init__(
             system_site_packages=True,
             clear=clear,
             symlinks=symlinks,
             upgrade=upgrade,
-            with_pip=with_pip,
+            with_pip=with_pip and not self.with_pip_from_host,
             prompt=prompt,
         )
 
+    def create(  # type: ignore[override]
+        self, env_dir: Union[str, bytes, "os.PathLike[str]", "os.PathLike[bytes]"]
+    ) -> types.SimpleNamespace:
+        """Create the environment, making the host's pip available in the environment's bin path.
+
+        .. note::
+
+            This can't be done in `post_setup`, since venv.EnvBuilder only enables system site packages after
+            `post_setup` has run.
+        """
+        context = super().create(env_dir)
+
+        if self.with_pip_from_host:
+            self._make_pip_available_in_bin_path(context)
+
+        return context
+
 
 def _make_packages_available_on_path(package_names) -> None:  # type: ignore[no-untyped-def]  # noqa: ANN001
     """Generate console scripts for listed packages to make them available on the path for the current environment.
@@ -6,6 +6,17 @@ from . import _fixtures
 from ._subplugins import IPythonMarkupPlugin, JupyterNotebookDiscoverer, PapermillTestRunner
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register command line options."""
+    group = parser.getgroup("iovis")
+    group.addoption(
+        "--iovis-shared-venv",
+        action="store_true",
+        default=False,
+        help="Share a single virtual environment across all tests that request the `venv` fixture.",
+    )
+
+
 def pytest_configure(config: pytest.Config) -> None:
     """Register sub-plugins."""
     # The name of this plugin
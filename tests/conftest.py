@@ -10,6 +10,13 @@ from pytest_iovis import PathType
 pytest_plugins = ["pytester"]
 
 
+@pytest.fixture()
+def testdir(testdir: pytest.Testdir, monkeypatch: pytest.MonkeyPatch) -> pytest.Testdir:
+    """Return the testdir fixture, but disable the cacheprovider plugin since nested pytest runs never use it."""
+    monkeypatch.setenv("PYTEST_ADDOPTS", "-p no:cacheprovider")
+    return testdir
+
+
 @pytest.fixture()
 def dummy_notebook_factory(testdir: pytest.Testdir) -> Callable[[Optional[PathType]], Path]:
     """Return a Callable that can be used to generate empty (dummy) notebooks.
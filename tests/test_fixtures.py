@@ -97,3 +97,31 @@ def test_venv(testdir: pytest.Testdir) -> None:
     res.assert_outcomes(passed=1)
 
     assert res.ret == 0, "pytest exited non-zero exitcode"
+
+
+def test_venv_shared(testdir: pytest.Testdir) -> None:
+    """Validate that `--iovis-shared-venv` makes all tests reuse the same virtual environment."""
+    testdir.makepyfile(
+        """
+        import sys
+        import types
+
+        import pytest
+
+        env_dirs = set()
+
+        @pytest.mark.parametrize("n", range(2))
+        def test_venv(venv: types.SimpleNamespace, n: int) -> None:
+            assert sys.executable == venv.env_exe
+            env_dirs.add(venv.env_dir)
+
+        def test_same_venv() -> None:
+            assert len(env_dirs) == 1
+    """
+    )
+
+    res = testdir.runpytest("--iovis-shared-venv", "test_venv_shared.py")
+
+    res.assert_outcomes(passed=3)
+
+    assert res.ret == 0, "pytest exited non-zero exitcode"
@@ -51,7 +51,7 @@ def override_test_functions(
 @pytest.fixture()
 def testdir(testdir: pytest.Testdir, monkeypatch: pytest.MonkeyPatch) -> pytest.Testdir:
     """Return the testdir fixture, but ensure that the grouping subplugin is disabled and doesn't affect output."""
-    monkeypatch.setenv("PYTEST_ADDOPTS", "-p no:iovis.papermill_runner")
+    monkeypatch.setenv("PYTEST_ADDOPTS", "-p no:iovis.papermill_runner", prepend=" ")
     return testdir
 
 
@@ -317,6 +317,36 @@ class TestCascadingConfiguration:
             ]
         )
 
+    def test_nested_conftests_loaded_up_front(
+        self,
+        testdir: pytest.Testdir,
+        dummy_notebook_factory: Callable[[Optional[PathType]], Path],
+    ) -> None:
+        """Validate that a conftest is indexed before those in its subdirectories when both are loaded at startup."""
+
+        def test_function1(notebook_path: object) -> None:  # noqa: ARG001
+            pass
+
+        def test_function2(notebook_path: object) -> None:  # noqa: ARG001
+            pass
+
+        # Ordering by conftest.py path would put baz/conftest.py before conftest.py, since "baz" < "conftest.py"
+        override_test_functions(testdir, test_function1)
+        override_test_functions(testdir, test_function2, inherit=True, directory="baz")
+
+        dummy_notebook_factory("baz/test.ipynb")
+
+        # Passing the subdirectory makes pytest load both conftests before collecting anything
+        res = testdir.runpytest("-v", "baz")
+
+        res.assert_outcomes(passed=2)
+        res.stdout.fnmatch_lines_random(
+            [
+                "baz/test.ipynb::test_function1 PASSED*",
+                "baz/test.ipynb::test_function2 PASSED*",
+            ]
+        )
+
     def test_nested_multiple_branches_with_conftest(
         self,
         testdir: pytest.Testdir,
@@ -633,6 +663,27 @@ class TestFileHook:
             consecutive=True,
         )
 
+    def test_file_hook_relative_path_under_symlinked_directory(
+        self,
+        testdir: pytest.Testdir,
+        dummy_notebook_factory: Callable[[Optional[PathType]], Path],
+    ) -> None:
+        """Validate that relative paths match the collected notebook when the conftest is reached via a symlink."""
+        dummy_notebook_factory("real/foo/test.ipynb")
+        Path(testdir.tmpdir, "link").symlink_to(Path(testdir.tmpdir, "real"), target_is_directory=True)
+
+        def file_hook():  # type: ignore[no-untyped-def]  # noqa: ANN202
+            def test_function(notebook_path: object) -> None:  # noqa: ARG001
+                pass
+
+            yield test_function
+
+        override_test_functions(testdir, inherit=True, tests_for={"foo/../foo/test.ipynb": file_hook}, directory="real")
+
+        res = testdir.runpytest("-v", "link")
+        res.assert_outcomes(passed=1)
+        res.stdout.fnmatch_lines(["link/foo/test.ipynb::test_function PASSED*"])
+
     def test_file_hook_handles_absolute_paths(
         self,
         testdir: pytest.Testdir,